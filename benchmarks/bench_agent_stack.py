@@ -0,0 +1,289 @@
+"""
+Benchmark suite for the Python agent stack.
+
+Builds synthetic registries, workflows and audit traffic at several scales
+and times AgentRegistry, AgentDiscovery, Orchestrator, DecisionAuditor and
+MatchAgent. Results can be written as JSON and compared against an earlier
+run to catch regressions.
+
+Usage:
+    python benchmarks/bench_agent_stack.py [--scales 100 1000 10000]
+        [--output results.json] [--baseline previous.json]
+        [--metrics json|prometheus] [--overhead]
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from governance.auditor import DecisionAuditor
+from match_agent.match_agent import MatchAgent
+from monitoring.metrics import metrics
+from orchestration.orchestrator import Orchestrator
+from registry.agent_registry import AgentRegistry
+
+# The discovery package directory is named "discovery.py", so load it by path
+_spec = importlib.util.spec_from_file_location("discovery", os.path.join(ROOT, "discovery.py", "discovery.py"))
+_discovery = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_discovery)
+AgentDiscovery = _discovery.AgentDiscovery
+
+# Capabilities Orchestrator.analyze_task derives from task types
+TASK_TYPES = {
+    "schedule_update": ["update_calendar"],
+    "task_assignment": ["evaluate", "assign"],
+    "learning_assessment": ["analyze", "suggest_module"],
+}
+WORKFLOW_CAPABILITIES = sorted({c for caps in TASK_TYPES.values() for c in caps})
+
+
+def generate_registry(n_agents, n_capabilities=None, capabilities_per_agent=4, seed=0):
+    """
+    Build a registry of synthetic agents.
+
+    Every agent gets random generic capabilities and one of the workflow
+    capabilities, plus a trust level and region in its metadata.
+
+    Args:
+        n_agents (int): Number of agents
+        n_capabilities (int, optional): Size of the generic capability pool (default: n_agents // 4)
+        capabilities_per_agent (int): Generic capabilities per agent
+        seed (int): Random seed
+
+    Returns:
+        AgentRegistry: Populated registry
+    """
+    rng = random.Random(seed)
+    pool = [f"capability_{i}" for i in range(max(capabilities_per_agent, n_capabilities or n_agents // 4))]
+    registry = AgentRegistry()
+    for i in range(n_agents):
+        capabilities = rng.sample(pool, capabilities_per_agent)
+        capabilities.append(WORKFLOW_CAPABILITIES[i % len(WORKFLOW_CAPABILITIES)])
+        registry.register_agent(f"agent_{i}", capabilities, {
+            "trust_level": round(rng.uniform(0.3, 1.0), 2),
+            "region": rng.choice(["eu", "us", "apac"])
+        })
+    return registry
+
+
+def generate_tasks(n_tasks, seed=0):
+    """
+    Build synthetic task descriptions for the orchestrator.
+
+    Args:
+        n_tasks (int): Number of tasks
+        seed (int): Random seed
+
+    Returns:
+        list: Task descriptions
+    """
+    rng = random.Random(seed)
+    return [{"type": rng.choice(list(TASK_TYPES)), "id": i} for i in range(n_tasks)]
+
+
+def generate_audit_records(n_records, seed=0):
+    """
+    Build synthetic decision records for the auditor.
+
+    Args:
+        n_records (int): Number of records
+        seed (int): Random seed
+
+    Returns:
+        list: Keyword arguments for DecisionAuditor.log_decision
+    """
+    rng = random.Random(seed)
+    return [{
+        "agent_id": f"agent_{rng.randrange(1000)}",
+        "decision_type": rng.choice(["workflow_creation", "workflow_completion", "task_assignment"]),
+        "inputs": {"task": i},
+        "outputs": {"result": rng.random()},
+        "reasoning": None
+    } for i in range(n_records)]
+
+
+def generate_match_problem(n_students, n_tasks, seed=0):
+    """
+    Build synthetic students and tasks for the match agent.
+
+    Args:
+        n_students (int): Number of students
+        n_tasks (int): Number of tasks
+        seed (int): Random seed
+
+    Returns:
+        tuple: (students, tasks)
+    """
+    rng = random.Random(seed)
+    students = [{"id": i, "skill_level": rng.randint(1, 10)} for i in range(n_students)]
+    tasks = [{"id": i, "difficulty": rng.randint(1, 10)} for i in range(n_tasks)]
+    return students, tasks
+
+
+def measure(func, inputs, max_seconds=1.0):
+    """
+    Call func with each input in turn until inputs or the time budget run out.
+
+    Args:
+        func (callable): Function taking one input
+        inputs (list): Inputs to cycle through
+        max_seconds (float): Time budget
+
+    Returns:
+        dict: Number of calls, ops/s and mean latency in microseconds
+    """
+    calls = 0
+    start = time.perf_counter()
+    deadline = start + max_seconds
+    for item in inputs:
+        func(item)
+        calls += 1
+        if time.perf_counter() > deadline:
+            break
+    elapsed = time.perf_counter() - start
+    return {"calls": calls, "ops_per_sec": calls / elapsed, "mean_us": elapsed / calls * 1e6}
+
+
+def run_scale(scale, max_seconds):
+    """
+    Run every benchmark for one registry size.
+
+    Args:
+        scale (int): Number of agents
+        max_seconds (float): Time budget per benchmark
+
+    Returns:
+        dict: Mapping of benchmark name -> result
+    """
+    rng = random.Random(scale)
+    results = {}
+
+    start = time.perf_counter()
+    registry = generate_registry(scale, seed=scale)
+    results["registry_build"] = {"calls": scale, "seconds": time.perf_counter() - start}
+
+    capabilities = list(registry.capabilities_index)
+    queries = [rng.choice(capabilities) for _ in range(10000)]
+    results["registry_discover"] = measure(
+        lambda capability: registry.discover_agents_by_capability(capability, 0.5), queries, max_seconds)
+
+    discovery = AgentDiscovery(registry)
+    patterns = [f"capability_{rng.randrange(scale // 4 or 1)}" for _ in range(1000)]
+    results["discovery_capability_pattern"] = measure(discovery.discover_by_capability_pattern, patterns, max_seconds)
+    agents = [f"agent_{rng.randrange(scale)}" for _ in range(1000)]
+    results["discovery_complementary"] = measure(discovery.discover_complementary_agents, agents, max_seconds)
+    results["discovery_metadata"] = measure(
+        lambda region: discovery.discover_by_metadata("region", region), ["eu", "us", "apac"] * 300, max_seconds)
+
+    orchestrator = Orchestrator(registry, DecisionAuditor())
+    tasks = generate_tasks(10000, seed=scale)
+    results["orchestrator_select_agents"] = measure(
+        lambda task: orchestrator.select_agents(orchestrator.analyze_task(task)), tasks, max_seconds)
+    workflow_ids = []
+    results["orchestrator_create_workflow"] = measure(
+        lambda task: workflow_ids.append(orchestrator.create_workflow(task)), tasks, max_seconds)
+    results["orchestrator_execute_workflow"] = measure(orchestrator.execute_workflow, workflow_ids, max_seconds)
+
+    auditor = DecisionAuditor()
+    results["auditor_log_decision"] = measure(
+        lambda record: auditor.log_decision(**record), generate_audit_records(100000, seed=scale), max_seconds)
+
+    students, match_tasks = generate_match_problem(max(scale // 10, 1), scale, seed=scale)
+    match_agent = MatchAgent()
+    results["match_agent_distribute_tasks"] = measure(
+        lambda _: match_agent.distribute_tasks(students, match_tasks), range(100), max_seconds)
+
+    return results
+
+
+def print_results(scale, results, baseline=None):
+    print(f"\n== {scale} agents ==")
+    for name, result in results.items():
+        if "ops_per_sec" not in result:
+            print(f"{name:<32} {result['seconds'] * 1000:12.1f} ms total")
+            continue
+        line = f"{name:<32} {result['ops_per_sec']:12,.0f} ops/s {result['mean_us']:12.1f} us/op"
+        previous = (baseline or {}).get(str(scale), {}).get(name)
+        if previous and "mean_us" in previous:
+            change = (result["mean_us"] - previous["mean_us"]) / previous["mean_us"] * 100
+            line += f"  {change:+7.1f}% vs baseline"
+        print(line)
+
+
+def measure_overhead(iterations=200000):
+    """
+    Compare an instrumented call with instrumentation disabled and enabled.
+
+    Args:
+        iterations (int): Calls per measurement
+
+    Returns:
+        dict: Mean nanoseconds per call for the plain, disabled and enabled variants
+    """
+    def plain():
+        return None
+
+    instrumented = metrics.timed("overhead_probe")(plain)
+    was_enabled = metrics.enabled
+    timings = {}
+    for label, func, enabled in (("plain", plain, False), ("disabled", instrumented, False),
+                                 ("enabled", instrumented, True)):
+        metrics.enabled = enabled
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        timings[label] = (time.perf_counter() - start) / iterations * 1e9
+    metrics.enabled = was_enabled
+    metrics.timers.pop("overhead_probe", None)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--max-seconds", type=float, default=1.0, help="time budget per benchmark")
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--metrics", choices=["json", "prometheus"],
+                        help="enable instrumentation and print the collected metrics")
+    parser.add_argument("--overhead", action="store_true", help="measure instrumentation overhead per call")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    if args.metrics:
+        metrics.enable()
+
+    all_results = {}
+    for scale in args.scales:
+        all_results[str(scale)] = run_scale(scale, args.max_seconds)
+        print_results(scale, all_results[str(scale)], baseline)
+
+    if args.overhead:
+        overhead = measure_overhead()
+        print("\n== instrumentation overhead ==")
+        for label, nanoseconds in overhead.items():
+            print(f"{label:<32} {nanoseconds:12.1f} ns/call")
+        all_results["overhead_ns"] = overhead
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(all_results, f, indent=2)
+
+    if args.metrics:
+        print()
+        print(metrics.export(args.metrics))
+
+
+if __name__ == "__main__":
+    main()
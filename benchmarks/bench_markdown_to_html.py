@@ -0,0 +1,71 @@
+"""
+Benchmark for Markdown rendering over the repository's own docs.
+
+Compares a fresh markdown.markdown() call per document against
+MarkdownRenderer (reused instance, warm cache, process pool).
+
+Usage:
+    python benchmarks/bench_markdown_to_html.py [--copies N] [--workers N]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+import markdown
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from markdown_to_html import MarkdownRenderer
+
+
+def load_documents(copies):
+    """
+    Load docs/**/*.md and make distinct copies so cold runs miss the cache.
+
+    Args:
+        copies (int): Number of copies of each document
+
+    Returns:
+        list: Markdown sources
+    """
+    paths = sorted(glob.glob(os.path.join(ROOT, "docs", "**", "*.md"), recursive=True))
+    sources = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            sources.append(f.read())
+    return [f"{text}\n\n<!-- copy {i} -->\n" for i in range(copies) for text in sources]
+
+
+def timed(label, func, count):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed * 1000:10.1f} ms  {count / elapsed:10.1f} docs/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--copies", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    documents = load_documents(args.copies)
+    print(f"{len(documents)} documents, {sum(map(len, documents)) / 1e6:.1f} MB")
+
+    timed("markdown.markdown() per doc", lambda: [markdown.markdown(d) for d in documents], len(documents))
+
+    renderer = MarkdownRenderer(cache_size=len(documents))
+    timed("renderer, cold", lambda: [renderer.render(d) for d in documents], len(documents))
+    timed("renderer, warm cache", lambda: [renderer.render(d) for d in documents], len(documents))
+
+    renderer = MarkdownRenderer(cache_size=len(documents))
+    timed(f"render_many, {args.workers} workers", lambda: renderer.render_many(documents, workers=args.workers),
+          len(documents))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Throughput and latency benchmark for the in-process message bus.
+
+Runs many concurrent agents that serve their mailboxes and measures
+one-way throughput (single and batched sends) and request/reply latency.
+
+Usage:
+    python benchmarks/bench_message_bus.py [--agents N] [--messages N]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from messaging.message_bus import MessageBus
+from registry.agent_registry import AgentRegistry
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def run(agents, messages, clients_per_agent):
+    registry = AgentRegistry()
+    bus = MessageBus(registry, {"mailbox_size": 1024})
+    received = [0]
+
+    def handler(message):
+        received[0] += 1
+        return message.payload
+
+    servers = []
+    for i in range(agents):
+        bus.register(f"agent_{i}", capabilities=["work", f"shard_{i % 8}"])
+        servers.append(asyncio.create_task(bus.serve(f"agent_{i}", handler)))
+
+    payload = {"task": "benchmark", "data": list(range(16))}
+    per_agent = messages // agents
+
+    async def drain():
+        while received[0] < per_agent * agents:
+            await asyncio.sleep(0)
+
+    received[0] = 0
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        asyncio.gather(*(bus.send(f"agent_{i}", payload) for _ in range(per_agent)))
+        for i in range(agents)
+    ))
+    await drain()
+    elapsed = time.perf_counter() - start
+    print(f"send            {per_agent * agents / elapsed:12,.0f} msg/s")
+
+    received[0] = 0
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        bus.send_batch(f"agent_{i}", [payload] * per_agent) for i in range(agents)
+    ))
+    await drain()
+    elapsed = time.perf_counter() - start
+    print(f"send_batch      {per_agent * agents / elapsed:12,.0f} msg/s")
+
+    latencies = []
+
+    async def client(count):
+        for _ in range(count):
+            start = time.perf_counter()
+            await bus.request_capability("work", payload)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(messages // (agents * clients_per_agent) or 1) for _ in range(agents * clients_per_agent)))
+    elapsed = time.perf_counter() - start
+    print(f"request/reply   {len(latencies) / elapsed:12,.0f} req/s  "
+          f"p50 {percentile(latencies, 0.5) * 1e6:8.1f} us  "
+          f"p99 {percentile(latencies, 0.99) * 1e6:8.1f} us  "
+          f"mean {statistics.mean(latencies) * 1e6:8.1f} us")
+
+    for server in servers:
+        server.cancel()
+    await asyncio.gather(*servers, return_exceptions=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--agents", type=int, default=100)
+    parser.add_argument("--messages", type=int, default=200_000)
+    parser.add_argument("--clients-per-agent", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"{args.agents} agents, {args.messages} messages")
+    asyncio.run(run(args.agents, args.messages, args.clients_per_agent))
+
+
+if __name__ == "__main__":
+    main()
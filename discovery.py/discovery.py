@@ -7,6 +7,8 @@ Extends basic registry functionality with more advanced discovery patterns.
 
 import datetime
 
+from monitoring.metrics import metrics
+
 class AgentDiscovery:
     """
     Enhanced agent discovery mechanisms beyond basic registry lookups.
@@ -24,6 +26,7 @@ class AgentDiscovery:
         self.discovery_cache = {}  # Cache for discovery results
         self.cache_expiry = 300  # Cache expiry in seconds (5 minutes)
 
+    @metrics.timed("discovery_capability_pattern")
     def discover_by_capability_pattern(self, pattern):
         """
         Find agents with capabilities matching a pattern.
@@ -45,6 +48,7 @@ class AgentDiscovery:
 
         return matching_agents
 
+    @metrics.timed("discovery_complementary")
     def discover_complementary_agents(self, agent_id):
         """
         Find agents with complementary capabilities to the specified agent.
@@ -74,6 +78,7 @@ class AgentDiscovery:
 
         return complementary_agents
 
+    @metrics.timed("discovery_metadata")
     def discover_by_metadata(self, metadata_key, metadata_value):
         """
         Find agents with specific metadata values.
@@ -1,4 +1,7 @@
 import datetime
+
+from monitoring.metrics import metrics
+
 class DecisionAuditor:
   """
   Audits and logs agent decisions for accountability and governance.
@@ -17,28 +20,8 @@ class DecisionAuditor:
       self.rules_engine = rules_engine
       self.current_audit_id = 0
 
-                   def log_decision(self, agent_id, decision_type, inputs, outputs, reasoning=None):
-                       """
-                       Log an agent decision in the audit trail.
-                       """
-                       audit_record = {
-                           "audit_id": self.current_audit_id,
-                           "timestamp": datetime.datetime.now().isoformat(),
-                           "agent_id": agent_id,
-                           "decision_type": decision_type,
-                           "inputs": inputs,
-                           "outputs": outputs,
-                           "reasoning": reasoning
-                       }
-
-                       # Increment audit ID for next record
-                       self.current_audit_id += 1
-
-                       # Store the record using storage backend if available
-                       if self.storage:
-                           self.storage.store_record(audit_record)
-
-
+  @metrics.timed("auditor_log_decision")
+  def log_decision(self, agent_id, decision_type, inputs, outputs, reasoning=None):
       """
       Log an agent decision in the audit trail.
 
@@ -50,32 +33,55 @@ class DecisionAuditor:
           reasoning (str, optional): Explanation of decision logic
 
       Returns:
-          str: Audit record ID
+          int: Audit record ID
       """
-      pass
-
-      def validate_decision(self, decision_data):
-          """
-          Validate a decision against governance rules.
-          """
-          valid = True
-          reasons = []
-
-          # Use rules engine if available
-          if self.rules_engine:
-              valid, rules_reasons = self.rules_engine.validate(decision_data)
-              reasons.extend(rules_reasons)
-
-          # Basic validation if no rules engine
-          else:
-              # Check for required fields
-              required_fields = ["agent_id", "decision_type", "inputs", "outputs"]
-              for field in required_fields:
-                  if field not in decision_data:
-                      valid = False
-                      reasons.append(f"Missing required field: {field}")
-
-          return (valid, reasons)
+      audit_record = {
+          "audit_id": self.current_audit_id,
+          "timestamp": datetime.datetime.now().isoformat(),
+          "agent_id": agent_id,
+          "decision_type": decision_type,
+          "inputs": inputs,
+          "outputs": outputs,
+          "reasoning": reasoning
+      }
+
+      # Increment audit ID for next record
+      self.current_audit_id += 1
+
+      # Store the record using storage backend if available
+      if self.storage:
+          self.storage.store_record(audit_record)
+
+      return audit_record["audit_id"]
+
+  def validate_decision(self, decision_data):
+      """
+      Validate a decision against governance rules.
+
+      Args:
+          decision_data (dict): Decision to validate
+
+      Returns:
+          tuple: (valid, reasons)
+      """
+      valid = True
+      reasons = []
+
+      # Use rules engine if available
+      if self.rules_engine:
+          valid, rules_reasons = self.rules_engine.validate(decision_data)
+          reasons.extend(rules_reasons)
+
+      # Basic validation if no rules engine
+      else:
+          # Check for required fields
+          required_fields = ["agent_id", "decision_type", "inputs", "outputs"]
+          for field in required_fields:
+              if field not in decision_data:
+                  valid = False
+                  reasons.append(f"Missing required field: {field}")
+
+      return (valid, reasons)
 
   def get_decision_history(self, agent_id=None, time_range=None, decision_type=None):
       """
@@ -142,14 +148,10 @@ class DecisionAuditor:
       Returns:
           str/bytes: Exported audit data
       """
-      passdef export_audit_log(self, format="json", time_range=None):
-          """
-          Export audit logs in specified format.
-          """
-          # If storage backend exists, export from there
-          if self.storage:
-              return self.storage.export_records(format=format, time_range=time_range)
-
-          # For MVP without storage, return empty export
-          print("No storage backend available for exporting audit logs")
-          return ""
\ No newline at end of file
+      # If storage backend exists, export from there
+      if self.storage:
+          return self.storage.export_records(format=format, time_range=time_range)
+
+      # For MVP without storage, return empty export
+      print("No storage backend available for exporting audit logs")
+      return ""
@@ -1,16 +1,115 @@
+try:
+    from learning_agent.module_catalog import ModuleCatalog
+except ImportError:  # Run as a script from inside learning_agent/
+    from module_catalog import ModuleCatalog
 
-  def __init__(self):
+class LearningAgent:
+
+  def __init__(self, catalog=None):
       # Initialize the agent with necessary configurations
-      pass
+      self.catalog = catalog
+
+  def evaluate_student(self, student_id, performance_data, k=5):
+      """
+      Evaluate student performance and suggest learning modules.
+
+      Args:
+          student_id (str): Identifier of the student
+          performance_data (dict): Performance data for the student
+              - scores (list): Overall scores (0-100)
+              - skills (dict, optional): Mapping of skill -> score (0-100)
+          k (int): Number of modules to suggest
+
+      Returns:
+          dict: Evaluation with average score, level and suggested modules
+      """
+      average = self._average_score(performance_data)
+      evaluation = {
+          "student_id": student_id,
+          "average_score": average,
+          "level": self._level(average),
+          "modules": []
+      }
+
+      if self.catalog:
+          evaluation["modules"] = self.catalog.recommend(
+              self._skill_gaps(performance_data), k=k, max_difficulty=evaluation["level"]
+          )
+
+      return evaluation
+
+  def evaluate_cohort(self, cohort, k=5):
+      """
+      Evaluate a cohort of students with a single batched catalog query.
+
+      Each student's modules are capped at their own level, as in
+      evaluate_student.
+
+      Args:
+          cohort (dict): Mapping of student_id -> performance_data
+          k (int): Number of modules to suggest per student
+
+      Returns:
+          dict: Mapping of student_id -> module IDs
+      """
+      if not self.catalog or not cohort:
+          return {student_id: [] for student_id in cohort}
+
+      student_ids = list(cohort)
+      gaps = [self.catalog.skill_vector(self._skill_gaps(cohort[s])) for s in student_ids]
+      levels = [self._level(self._average_score(cohort[s])) for s in student_ids]
+      recommendations = self.catalog.recommend_batch(gaps, k=k, max_difficulty=levels)
+      return dict(zip(student_ids, recommendations))
+
+  def _skill_gaps(self, performance_data):
+      """
+      Internal method to turn per-skill scores into a skill-gap mapping.
+
+      Skills without a score are treated as not yet started.
+
+      Args:
+          performance_data (dict): Performance data for the student
+
+      Returns:
+          dict: Mapping of skill -> gap (0 = mastered, 1 = not started)
+      """
+      skill_scores = performance_data.get("skills", {})
+      return {
+          skill: 1 - min(max(skill_scores.get(skill, 0), 0), 100) / 100
+          for skill in self.catalog.skills
+      }
+
+  def _average_score(self, performance_data):
+      """
+      Internal method to average a student's overall scores.
+
+      Args:
+          performance_data (dict): Performance data for the student
+
+      Returns:
+          float: Average score (0 without scores)
+      """
+      scores = performance_data.get("scores", [])
+      return sum(scores) / len(scores) if scores else 0
+
+  def _level(self, average):
+      """
+      Internal method to map an average score to a difficulty level (1-5).
+
+      Args:
+          average (float): Average score (0-100)
 
-  def evaluate_student(self, student_id, performance_data):
-      # Placeholder method for evaluating student performance
-      # Implement the logic to analyze performance data and suggest learning modules
-      pass
+      Returns:
+          int: Difficulty level
+      """
+      return min(5, max(1, int(average // 20) + 1))
 
 # Example usage
 if __name__ == "__main__":
-  agent = LearningAgent()
+  catalog = ModuleCatalog(["python", "testing", "design"])
+  catalog.add_module("intro_python", {"python": 1.0}, difficulty=1)
+  catalog.add_module("unit_testing", {"python": 0.3, "testing": 1.0}, difficulty=3)
+  agent = LearningAgent(catalog)
   student_id = "student_123"
-  performance_data = {"scores": [85, 90, 78]}
-  agent.evaluate_student(student_id, performance_data)
+  performance_data = {"scores": [85, 90, 78], "skills": {"python": 80}}
+  print(agent.evaluate_student(student_id, performance_data))
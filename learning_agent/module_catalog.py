@@ -0,0 +1,443 @@
+"""
+Learning Module Catalog
+
+Catalog of learning modules indexed by skill/topic and difficulty.
+Recommends modules by nearest-neighbour search over skill vectors: exact
+cosine search with NumPy for small catalogs and random-projection LSH for
+large ones.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+
+class ModuleCatalog:
+    """
+    Catalog of learning modules with skill and difficulty indexes.
+
+    Every module is described by a vector over the catalog's skill axes.
+    Students are described by a vector over the same axes (typically the
+    skill gaps they need to close), and recommendations are the modules
+    whose vectors are most similar to the student's vector.
+    """
+
+    def __init__(self, skills, config=None):
+        """
+        Initialize the module catalog.
+
+        Args:
+            skills (list): Skill/topic names, one per vector dimension
+            config (dict, optional): Configuration parameters for the catalog
+                - exact_threshold (int): Catalog size up to which exact search is used
+                - lsh_tables (int): Number of LSH hash tables
+                - lsh_bits (int): Number of random hyperplanes per table
+                - bucket_size (float): Quantization step for the recommendation cache
+                - cache_size (int): Maximum number of cached skill-profile buckets
+                - batch_chunk_size (int): Students scored per matrix product in recommend_batch
+                - seed (int): Seed for the random projections
+        """
+        if not skills:
+            raise ValueError("Catalog requires at least one skill")
+
+        self.skills = list(skills)
+        self.skill_positions = {skill: i for i, skill in enumerate(self.skills)}
+        self.config = config or {}
+
+        self.modules = {}  # Dictionary of module_id -> module_details
+        self.skill_index = {}  # Index of skill -> [module_ids]
+        self.difficulty_index = {}  # Index of difficulty -> [module_ids]
+
+        self.exact_threshold = self.config.get("exact_threshold", 2048)
+        self.lsh_tables = self.config.get("lsh_tables", 8)
+        self.lsh_bits = self.config.get("lsh_bits", 12)
+        self.bucket_size = self.config.get("bucket_size", 0.1)
+        self.cache_size = self.config.get("cache_size", 1024)
+        self.batch_chunk_size = self.config.get("batch_chunk_size", 1024)
+
+        rng = np.random.default_rng(self.config.get("seed", 0))
+        self._planes = rng.standard_normal((self.lsh_tables, len(self.skills), self.lsh_bits))
+        self._bit_weights = 1 << np.arange(self.lsh_bits, dtype=np.int64)
+
+        self._module_ids = []
+        self._vectors = np.zeros((0, len(self.skills)))
+        self._difficulties = np.zeros(0)
+        self._lsh_buckets = None
+        self._dirty = False
+        self.recommendation_cache = OrderedDict()  # Cache of bucket key -> module_ids
+
+    def add_module(self, module_id, skills, difficulty, metadata=None):
+        """
+        Add a learning module to the catalog.
+
+        Args:
+            module_id (str): Unique identifier for the module
+            skills (dict): Mapping of skill -> weight the module trains
+            difficulty (int): Difficulty level of the module
+            metadata (dict, optional): Additional module information
+
+        Raises:
+            ValueError: If module_id already exists or skills are invalid
+        """
+        if module_id in self.modules:
+            raise ValueError(f"Module {module_id} already exists")
+
+        vector = self.skill_vector(skills)
+        if not vector.any():
+            raise ValueError(f"Module {module_id} must train at least one skill")
+
+        self.modules[module_id] = {
+            "id": module_id,
+            "skills": dict(skills),
+            "difficulty": difficulty,
+            "metadata": metadata or {}
+        }
+
+        for skill, weight in skills.items():
+            if weight:
+                self.skill_index.setdefault(skill, []).append(module_id)
+        self.difficulty_index.setdefault(difficulty, []).append(module_id)
+
+        self._dirty = True
+        self.recommendation_cache.clear()
+
+    def get_modules_by_skill(self, skill, difficulty=None):
+        """
+        Look up modules that train a skill, optionally at one difficulty.
+
+        Args:
+            skill (str): Skill/topic to look up
+            difficulty (int, optional): Restrict to this difficulty level
+
+        Returns:
+            list: Module IDs training the skill
+        """
+        module_ids = self.skill_index.get(skill, [])
+        if difficulty is None:
+            return list(module_ids)
+        return [m for m in module_ids if self.modules[m]["difficulty"] == difficulty]
+
+    def get_modules_by_difficulty(self, difficulty):
+        """
+        Look up modules at a difficulty level.
+
+        Args:
+            difficulty (int): Difficulty level
+
+        Returns:
+            list: Module IDs at that difficulty
+        """
+        return list(self.difficulty_index.get(difficulty, []))
+
+    def skill_vector(self, skills):
+        """
+        Convert a skill mapping to a vector over the catalog's skill axes.
+
+        Args:
+            skills (dict): Mapping of skill -> value
+
+        Returns:
+            numpy.ndarray: Vector of length len(self.skills)
+
+        Raises:
+            ValueError: If a skill is not part of the catalog
+        """
+        vector = np.zeros(len(self.skills))
+        for skill, value in skills.items():
+            if skill not in self.skill_positions:
+                raise ValueError(f"Unknown skill: {skill}")
+            vector[self.skill_positions[skill]] = value
+        return vector
+
+    def recommend(self, skill_vector, k=5, max_difficulty=None):
+        """
+        Recommend the k modules nearest to a student's skill vector.
+
+        Uses exact search while the catalog is at most exact_threshold
+        modules and LSH candidate lookup beyond that. Results are cached
+        per quantized skill-profile bucket. An all-zero vector (no skill
+        gaps) gets no recommendations.
+
+        Args:
+            skill_vector (array-like or dict): Student vector or skill mapping
+            k (int): Number of modules to recommend
+            max_difficulty (int, optional): Highest difficulty to recommend
+
+        Returns:
+            list: Module IDs ordered by similarity
+        """
+        query = self._as_query(skill_vector)
+        if not query.any():
+            return []
+        self._build_index()
+
+        cache_key = self._cache_key(query, k, max_difficulty)
+        cached = self._get_from_cache(cache_key)
+        if cached is not None:
+            return list(cached)
+
+        if len(self._module_ids) > self.exact_threshold:
+            result = self._search_lsh(query, k, max_difficulty)
+        else:
+            result = self._search_exact(query[np.newaxis, :], k, max_difficulty)[0]
+
+        self._add_to_cache(cache_key, result)
+        return list(result)
+
+    def recommend_batch(self, skill_vectors, k=5, max_difficulty=None):
+        """
+        Recommend modules for a whole cohort.
+
+        Students whose skill-profile bucket is cached are served from the
+        cache, and students sharing a bucket are searched once. Below
+        exact_threshold the remaining students are scored with one matrix
+        product per batch_chunk_size students, which bounds the score matrix
+        to batch_chunk_size x catalog size; above it each one uses LSH like
+        recommend(). Results match calling recommend() per student, so
+        all-zero rows get no recommendations.
+
+        Args:
+            skill_vectors (array-like): Matrix with one student vector per row
+            k (int): Number of modules to recommend per student
+            max_difficulty (int or list, optional): Highest difficulty to recommend,
+                either for everyone or one entry (or None) per student
+
+        Returns:
+            list: One list of module IDs per student, ordered by similarity
+        """
+        queries = np.atleast_2d(np.asarray(skill_vectors, dtype=float))
+        if queries.shape[1] != len(self.skills):
+            raise ValueError(f"Expected vectors of length {len(self.skills)}")
+
+        if max_difficulty is None or np.isscalar(max_difficulty):
+            limits = [max_difficulty] * len(queries)
+        else:
+            limits = list(max_difficulty)
+            if len(limits) != len(queries):
+                raise ValueError(f"Expected {len(queries)} difficulty limits, got {len(limits)}")
+
+        self._build_index()
+        queries = self._normalize(queries)
+
+        results = [None] * len(queries)
+        pending = {}  # Cache key -> rows of students in that bucket
+        for row, query in enumerate(queries):
+            if not query.any():
+                results[row] = []
+                continue
+            cache_key = self._cache_key(query, k, limits[row])
+            cached = self._get_from_cache(cache_key)
+            if cached is not None:
+                results[row] = list(cached)
+            else:
+                pending.setdefault(cache_key, []).append(row)
+
+        if pending:
+            first_rows = [rows[0] for rows in pending.values()]
+            if len(self._module_ids) > self.exact_threshold:
+                found = [self._search_lsh(queries[row], k, limits[row]) for row in first_rows]
+            else:
+                found = []
+                for start in range(0, len(first_rows), self.batch_chunk_size):
+                    chunk = first_rows[start:start + self.batch_chunk_size]
+                    chunk_limits = [limits[row] for row in chunk]
+                    if all(limit is None for limit in chunk_limits):
+                        chunk_limits = None
+                    else:
+                        chunk_limits = np.array([np.inf if limit is None else limit for limit in chunk_limits])
+                    found.extend(self._search_exact(queries[chunk], k, chunk_limits))
+
+            for (cache_key, rows), result in zip(pending.items(), found):
+                self._add_to_cache(cache_key, result)
+                for row in rows:
+                    results[row] = list(result)
+
+        return results
+
+    def _cache_key(self, query, k, max_difficulty):
+        """
+        Internal method to compute the skill-profile bucket of a normalized query.
+
+        Args:
+            query (numpy.ndarray): Normalized query vector
+            k (int): Number of results
+            max_difficulty (int, optional): Highest difficulty to include
+
+        Returns:
+            tuple: Cache key
+        """
+        return (tuple(np.round(query / self.bucket_size).astype(int)), k, max_difficulty)
+
+    def _get_from_cache(self, cache_key):
+        """
+        Internal method to look up cached recommendations.
+
+        Args:
+            cache_key (tuple): Cache key to look up
+
+        Returns:
+            list or None: Cached module IDs or None if not found
+        """
+        cached = self.recommendation_cache.get(cache_key)
+        if cached is not None:
+            self.recommendation_cache.move_to_end(cache_key)
+        return cached
+
+    def _add_to_cache(self, cache_key, result):
+        """
+        Internal method to cache recommendations, evicting the least recently used bucket.
+
+        Args:
+            cache_key (tuple): Cache key to store the result under
+            result (list): Module IDs
+        """
+        self.recommendation_cache[cache_key] = result
+        if len(self.recommendation_cache) > self.cache_size:
+            self.recommendation_cache.popitem(last=False)
+
+    def _as_query(self, skill_vector):
+        """
+        Internal method to turn a vector or skill mapping into a unit query.
+
+        Args:
+            skill_vector (array-like or dict): Student vector or skill mapping
+
+        Returns:
+            numpy.ndarray: Normalized query vector
+        """
+        if isinstance(skill_vector, dict):
+            vector = self.skill_vector(skill_vector)
+        else:
+            vector = np.asarray(skill_vector, dtype=float)
+            if vector.shape != (len(self.skills),):
+                raise ValueError(f"Expected a vector of length {len(self.skills)}")
+        return self._normalize(vector[np.newaxis, :])[0]
+
+    def _normalize(self, vectors):
+        """
+        Internal method to scale rows to unit length (zero rows stay zero).
+
+        Args:
+            vectors (numpy.ndarray): Matrix of row vectors
+
+        Returns:
+            numpy.ndarray: Row-normalized matrix
+        """
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    def _build_index(self):
+        """
+        Internal method to rebuild the vector matrix and LSH tables after changes.
+        """
+        if not self._dirty:
+            return
+
+        self._module_ids = list(self.modules)
+        vectors = np.array([self.skill_vector(self.modules[m]["skills"]) for m in self._module_ids])
+        self._vectors = self._normalize(vectors)
+        self._difficulties = np.array([self.modules[m]["difficulty"] for m in self._module_ids])
+
+        self._lsh_buckets = None
+        if len(self._module_ids) > self.exact_threshold:
+            self._lsh_buckets = []
+            signatures = self._signatures(self._vectors)
+            for table in range(self.lsh_tables):
+                buckets = {}
+                for row, signature in enumerate(signatures[table]):
+                    buckets.setdefault(int(signature), []).append(row)
+                self._lsh_buckets.append({key: np.array(rows) for key, rows in buckets.items()})
+
+        self._dirty = False
+
+    def _signatures(self, vectors):
+        """
+        Internal method to hash vectors with the random hyperplanes.
+
+        Args:
+            vectors (numpy.ndarray): Matrix of row vectors
+
+        Returns:
+            numpy.ndarray: Signatures with shape (lsh_tables, len(vectors))
+        """
+        bits = np.einsum("nd,tdb->tnb", vectors, self._planes) > 0
+        return bits @ self._bit_weights
+
+    def _search_exact(self, queries, k, max_difficulty):
+        """
+        Internal method for exact cosine top-k over the whole catalog.
+
+        Args:
+            queries (numpy.ndarray): Normalized query matrix
+            k (int): Number of results per query
+            max_difficulty (int or numpy.ndarray, optional): Highest difficulty
+                to include, for all queries or one per query
+
+        Returns:
+            list: One list of module IDs per query
+        """
+        if not self._module_ids:
+            return [[] for _ in range(len(queries))]
+
+        scores = queries @ self._vectors.T
+        return self._top_k(scores, np.arange(len(self._module_ids)), k, max_difficulty)
+
+    def _search_lsh(self, query, k, max_difficulty):
+        """
+        Internal method for approximate top-k using LSH candidates.
+
+        Falls back to exact search when the buckets hold fewer than k
+        eligible candidates.
+
+        Args:
+            query (numpy.ndarray): Normalized query vector
+            k (int): Number of results
+            max_difficulty (int, optional): Highest difficulty to include
+
+        Returns:
+            list: Module IDs ordered by similarity
+        """
+        signatures = self._signatures(query[np.newaxis, :])[:, 0]
+        hits = [self._lsh_buckets[t].get(int(s)) for t, s in enumerate(signatures)]
+        hits = [rows for rows in hits if rows is not None]
+
+        if hits:
+            candidates = np.unique(np.concatenate(hits))
+            if max_difficulty is not None:
+                candidates = candidates[self._difficulties[candidates] <= max_difficulty]
+            if len(candidates) >= k:
+                scores = (self._vectors[candidates] @ query)[np.newaxis, :]
+                return self._top_k(scores, candidates, k, None)[0]
+
+        return self._search_exact(query[np.newaxis, :], k, max_difficulty)[0]
+
+    def _top_k(self, scores, rows, k, max_difficulty):
+        """
+        Internal method to select the k best-scoring rows per query.
+
+        Args:
+            scores (numpy.ndarray): Score matrix with one row per query
+            rows (numpy.ndarray): Catalog row for each score column
+            k (int): Number of results per query
+            max_difficulty (int or numpy.ndarray, optional): Highest difficulty
+                to include, for all queries or one per query
+
+        Returns:
+            list: One list of module IDs per query
+        """
+        if max_difficulty is not None:
+            eligible = self._difficulties[rows][np.newaxis, :] <= np.reshape(max_difficulty, (-1, 1))
+            scores = np.where(eligible, scores, -np.inf)
+        k = min(k, scores.shape[1])
+        if k <= 0:
+            return [[] for _ in range(len(scores))]
+
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        ranking = np.argsort(-top_scores, axis=1, kind="stable")
+        order = np.take_along_axis(top, ranking, axis=1)
+        order_scores = np.take_along_axis(top_scores, ranking, axis=1)
+        return [
+            [self._module_ids[rows[c]] for c, score in zip(row, row_scores) if score > -np.inf]
+            for row, row_scores in zip(order, order_scores)
+        ]
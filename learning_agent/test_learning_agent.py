@@ -0,0 +1,47 @@
+import unittest
+from learning_agent.learning_agent import LearningAgent
+from learning_agent.module_catalog import ModuleCatalog
+
+class TestLearningAgent(unittest.TestCase):
+    def setUp(self):
+        catalog = ModuleCatalog(["python", "testing"])
+        catalog.add_module("intro_python", {"python": 1.0}, difficulty=1)
+        catalog.add_module("unit_testing", {"testing": 1.0}, difficulty=2)
+        self.agent = LearningAgent(catalog)
+
+    def test_evaluate_student(self):
+        performance_data = {"scores": [30, 40], "skills": {"python": 90, "testing": 10}}
+        evaluation = self.agent.evaluate_student("student_123", performance_data, k=1)
+        self.assertEqual(evaluation["average_score"], 35)
+        self.assertEqual(evaluation["level"], 2)
+        self.assertEqual(evaluation["modules"], ["unit_testing"])
+
+    def test_evaluate_cohort(self):
+        cohort = {
+            "a": {"scores": [40], "skills": {"python": 90, "testing": 10}},
+            "b": {"scores": [40], "skills": {"python": 10, "testing": 90}}
+        }
+        self.assertEqual(self.agent.evaluate_cohort(cohort, k=1), {"a": ["unit_testing"], "b": ["intro_python"]})
+
+    def test_evaluate_cohort_matches_single_across_levels(self):
+        catalog = ModuleCatalog(["python", "testing"])
+        catalog.add_module("intro_testing", {"testing": 0.8, "python": 0.2}, difficulty=1)
+        catalog.add_module("adv_testing", {"testing": 1.0}, difficulty=5)
+        agent = LearningAgent(catalog)
+        cohort = {
+            "beginner": {"scores": [10], "skills": {"python": 100, "testing": 0}},
+            "expert": {"scores": [95], "skills": {"python": 100, "testing": 0}}
+        }
+
+        cohort_modules = agent.evaluate_cohort(cohort, k=1)
+        self.assertEqual(cohort_modules, {"beginner": ["intro_testing"], "expert": ["adv_testing"]})
+        for student_id, performance_data in cohort.items():
+            single = LearningAgent(catalog).evaluate_student(student_id, performance_data, k=1)
+            self.assertEqual(single["modules"], cohort_modules[student_id])
+
+    def test_evaluate_without_catalog(self):
+        evaluation = LearningAgent().evaluate_student("student_123", {"scores": [85, 90, 78]})
+        self.assertEqual(evaluation["modules"], [])
+
+if __name__ == '__main__':
+    unittest.main()
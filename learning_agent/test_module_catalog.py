@@ -0,0 +1,88 @@
+import unittest
+import numpy as np
+from learning_agent.module_catalog import ModuleCatalog
+
+class TestModuleCatalog(unittest.TestCase):
+    def setUp(self):
+        self.catalog = ModuleCatalog(["python", "testing", "design"])
+        self.catalog.add_module("intro_python", {"python": 1.0}, difficulty=1)
+        self.catalog.add_module("unit_testing", {"python": 0.3, "testing": 1.0}, difficulty=3)
+        self.catalog.add_module("architecture", {"design": 1.0}, difficulty=5)
+
+    def test_indexes(self):
+        self.assertEqual(self.catalog.get_modules_by_skill("python"), ["intro_python", "unit_testing"])
+        self.assertEqual(self.catalog.get_modules_by_skill("python", difficulty=3), ["unit_testing"])
+        self.assertEqual(self.catalog.get_modules_by_difficulty(5), ["architecture"])
+
+    def test_duplicate_and_unknown_skill(self):
+        with self.assertRaises(ValueError):
+            self.catalog.add_module("intro_python", {"python": 1.0}, difficulty=1)
+        with self.assertRaises(ValueError):
+            self.catalog.add_module("cooking", {"baking": 1.0}, difficulty=1)
+
+    def test_recommend_exact(self):
+        self.assertEqual(self.catalog.recommend({"testing": 1.0}, k=2), ["unit_testing", "intro_python"])
+        self.assertEqual(self.catalog.recommend({"design": 1.0}, k=1, max_difficulty=3), ["intro_python"])
+
+    def test_no_recommendations_without_skill_gaps(self):
+        self.assertEqual(self.catalog.recommend({}), [])
+        self.assertEqual(self.catalog.recommend_batch([[0, 0, 0], [1, 0, 0]], k=1), [[], ["intro_python"]])
+        self.assertEqual(len(self.catalog.recommendation_cache), 1)
+
+    def test_recommend_cache_invalidated_on_add(self):
+        self.catalog.recommend({"design": 1.0}, k=1)
+        self.assertEqual(len(self.catalog.recommendation_cache), 1)
+        self.catalog.add_module("patterns", {"design": 1.0, "python": 0.1}, difficulty=2)
+        self.assertEqual(len(self.catalog.recommendation_cache), 0)
+
+    def test_recommend_batch_matches_single(self):
+        cohort = [[1, 0, 0], [0, 1, 0], [0, 0.2, 1]]
+        batch = self.catalog.recommend_batch(cohort, k=2)
+        self.assertEqual(batch, [self.catalog.recommend(v, k=2) for v in cohort])
+
+    def test_recommend_batch_per_student_difficulty(self):
+        cohort = [[0, 0, 1], [0, 0, 1], [0, 1, 0]]
+        batch = self.catalog.recommend_batch(cohort, k=2, max_difficulty=[5, 1, None])
+        self.assertEqual(batch[0][0], "architecture")
+        self.assertEqual(batch[1], ["intro_python"])
+        self.assertEqual(batch[2], ["unit_testing", "intro_python"])
+        with self.assertRaises(ValueError):
+            self.catalog.recommend_batch(cohort, max_difficulty=[1, 2])
+
+    def test_recommend_batch_uses_cache_and_chunks(self):
+        catalog = ModuleCatalog(["python", "testing", "design"], {"batch_chunk_size": 2})
+        for module_id, module in self.catalog.modules.items():
+            catalog.add_module(module_id, module["skills"], module["difficulty"])
+
+        cohort = [[1, 0, 0], [0, 1, 0], [0, 0, 1], [1, 0, 0]]
+        batch = catalog.recommend_batch(cohort, k=1)
+        self.assertEqual(batch, [["intro_python"], ["unit_testing"], ["architecture"], ["intro_python"]])
+        self.assertEqual(len(catalog.recommendation_cache), 3)
+
+        catalog._search_exact = None  # Everything must now come from the cache
+        self.assertEqual(catalog.recommend_batch(cohort, k=1), batch)
+
+    def test_recommend_lsh(self):
+        rng = np.random.default_rng(1)
+        skills = [f"skill_{i}" for i in range(16)]
+        catalog = ModuleCatalog(skills, {"exact_threshold": 50})
+        vectors = rng.random((500, len(skills)))
+        for i, vector in enumerate(vectors):
+            catalog.add_module(f"m{i}", dict(zip(skills, vector)), difficulty=i % 5 + 1)
+
+        query = vectors[42]
+        result = catalog.recommend(query, k=5)
+        self.assertEqual(len(result), 5)
+        self.assertIn("m42", result)
+        self.assertTrue(all(catalog.modules[m]["difficulty"] <= 2
+                            for m in catalog.recommend(query, k=5, max_difficulty=2)))
+
+        self.assertEqual(catalog.recommend(np.zeros(len(skills))), [])
+
+        catalog.recommendation_cache.clear()
+        batch = catalog.recommend_batch(vectors[:20], k=5, max_difficulty=[3] * 20)
+        catalog.recommendation_cache.clear()
+        self.assertEqual(batch, [catalog.recommend(v, k=5, max_difficulty=3) for v in vectors[:20]])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,511 @@
+"""
+Markdown to HTML rendering.
+
+markdown_to_html() converts a single document. MarkdownRenderer reuses one
+configured Markdown instance across documents, caches rendered HTML by
+content hash (in memory and optionally on disk), and renders directories or
+iterables of documents in bulk on a process pool. For very large documents
+it can also render incrementally: the source is split into top-level blocks,
+each block is rendered (and cached) on its own, and HTML is streamed out.
+"""
+
+import glob
+import hashlib
+import itertools
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
 import markdown
 
+FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+LIST_ITEM_RE = re.compile(r"^ {0,3}([*+-]|\d+\.)[ \t]")
+HTML_START_RE = re.compile(r"^ {0,3}<([a-zA-Z][a-zA-Z0-9-]*)(?:[\s/>]|$)")
+REFERENCE_RE = re.compile(r"^ {0,3}\[[^\[\]]*\]:")
+LABEL_RE = re.compile(r"\[([^\[\]]*)\]")
+
+
+def split_blocks(lines):
+    """
+    Split Markdown source into independently renderable top-level blocks.
+
+    Blocks are separated by blank lines, except where a blank line does not
+    end the construct: indented continuations, consecutive list items or
+    blockquotes, fenced code and unclosed raw HTML are kept together.
+
+    Args:
+        lines (iterable): Source lines (a file object works)
+
+    Yields:
+        str: Block source
+    """
+    block = []
+    blanks = []
+    fence = None
+    html_close = None
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+
+        if not line.strip():
+            if block:
+                blanks.append(line)
+            continue
+
+        if block and blanks and fence is None and html_close is None and _starts_block(line, block):
+            yield "\n".join(block)
+            block = []
+            blanks = []
+        block.extend(blanks)
+        blanks = []
+
+        if fence is None and html_close is None:
+            match = HTML_START_RE.match(line)
+            if line.lstrip().startswith("<!--"):
+                html_close = "-->"
+            elif match and match.group(1).lower() in markdown.util.BLOCK_LEVEL_ELEMENTS \
+                    and match.group(1).lower() != "hr":
+                html_close = f"</{match.group(1).lower()}>"
+        block.append(line)
+
+        if html_close is not None and html_close in line.lower():
+            html_close = None
+
+        match = FENCE_RE.match(line)
+        if fence is None and match:
+            fence = match.group(1)
+        elif fence is not None and match and match.group(1)[0] == fence[0] \
+                and len(match.group(1)) >= len(fence) and not line.strip().strip(fence[0]):
+            fence = None
+
+    if block:
+        yield "\n".join(block)
+
+
+def _starts_block(line, block):
+    """
+    Check whether a line after a blank line starts a new top-level block.
+
+    List items and blockquotes attach to a list or blockquote anywhere
+    earlier in the block, so those are kept together.
+
+    Args:
+        line (str): First non-blank line after the blank lines
+        block (list): Lines of the current block
+
+    Returns:
+        bool: True if the line starts a new block
+    """
+    if line[0] in " \t":
+        return False
+    if LIST_ITEM_RE.match(line) and any(LIST_ITEM_RE.match(l) for l in block):
+        return False
+    if line.startswith(">") and any(l.lstrip().startswith(">") for l in block):
+        return False
+    return True
+
+
+def _reference_definitions(lines):
+    """
+    Collect link reference definitions, which apply to the whole document.
+
+    Only text that Python-Markdown's ReferenceProcessor consumes as a
+    definition is collected; a definition may continue onto the next two
+    lines of its paragraph (URL and title).
+
+    Args:
+        lines (iterable): Source lines
+
+    Returns:
+        dict: Mapping of normalized label -> definitions in document order
+    """
+    definitions = {}
+    paragraph = []
+    for line in itertools.chain(lines, [""]):
+        line = line.rstrip("\r\n")
+        if line.strip():
+            paragraph.append(line)
+            continue
+
+        i = 0
+        while i < len(paragraph):
+            match = REFERENCE_RE.match(paragraph[i]) \
+                and markdown.blockprocessors.ReferenceProcessor.RE.match("\n".join(paragraph[i:i + 3]))
+            if match:
+                definitions.setdefault(_reference_label(match.group(1)), []).append(match.group(0))
+                i += match.group(0).count("\n")
+            i += 1
+        paragraph = []
+    return definitions
+
+
+def _block_definitions(block, definitions):
+    """
+    Select the reference definitions a block may use.
+
+    Every bracketed label in the block is looked up, so the result covers
+    all of the block's reference links and images.
+
+    Args:
+        block (str): Block source
+        definitions (dict): Mapping of normalized label -> definitions
+
+    Returns:
+        str: Definitions to render with the block, one per paragraph
+    """
+    labels = dict.fromkeys(_reference_label(label) for label in LABEL_RE.findall(block))
+    return "".join(f"{definition}\n\n" for label in labels for definition in definitions.get(label, ()))
+
+
+def _reference_label(label):
+    """
+    Normalize a reference label the way Python-Markdown compares them.
+
+    Args:
+        label (str): Label text between the brackets
+
+    Returns:
+        str: Lower-cased label with whitespace runs collapsed
+    """
+    return " ".join(label.lower().split())
+
+
+class MarkdownRenderer:
+    """
+    Reusable Markdown renderer with a content-hash keyed HTML cache.
+    """
+
+    def __init__(self, extensions=None, extension_configs=None, cache_size=1024, cache_dir=None,
+                 block_cache_size=65536):
+        """
+        Initialize the renderer.
+
+        Args:
+            extensions (list, optional): Markdown extension names or Extension instances
+            extension_configs (dict, optional): Mapping of extension name -> config
+            cache_size (int): Maximum number of documents kept in the memory cache
+            cache_dir (str, optional): Directory for the on-disk HTML cache
+            block_cache_size (int): Maximum number of blocks kept in iter_render()'s memory cache
+        """
+        self.extensions = list(extensions or [])
+        self.extension_configs = dict(extension_configs or {})
+        self.cache_size = cache_size
+        self.cache_dir = cache_dir
+        self.cache = OrderedDict()  # Cache of content hash -> html
+        self.block_cache_size = block_cache_size
+        self.block_cache = OrderedDict()  # Cache of block content hash -> html, for iter_render
+        self._md = markdown.Markdown(extensions=self.extensions, extension_configs=self.extension_configs)
+        self._lock = threading.Lock()  # Guards the shared Markdown instance
+        self._cache_lock = threading.Lock()  # Guards the memory cache
+        self._config_key = json.dumps({
+            "extensions": [_extension_key(extension) for extension in self.extensions],
+            "extension_configs": self.extension_configs
+        }, sort_keys=True, default=str).encode("utf-8")
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def render(self, markdown_text):
+        """
+        Render a document, using the cache when the content was seen before.
+
+        Args:
+            markdown_text (str): Markdown source
+
+        Returns:
+            str: Rendered HTML
+        """
+        key = self.cache_key(markdown_text)
+        html = self._get_from_cache(key)
+        if html is None:
+            html = self.convert(markdown_text)
+            self._add_to_cache(key, html)
+        return html
+
+    def convert(self, markdown_text):
+        """
+        Render a document with the shared Markdown instance, bypassing the cache.
+
+        Args:
+            markdown_text (str): Markdown source
+
+        Returns:
+            str: Rendered HTML
+        """
+        with self._lock:
+            html = self._md.convert(markdown_text)
+            self._md.reset()
+        return html
+
+    def render_many(self, documents, workers=None, chunksize=8):
+        """
+        Render an iterable of documents, converting cache misses on a process pool.
+
+        Identical documents are only converted once.
+
+        Args:
+            documents (iterable): Markdown sources
+            workers (int, optional): Number of worker processes (default: CPU count)
+            chunksize (int): Documents sent to a worker per task
+
+        Returns:
+            list: Rendered HTML in the order of the input documents
+        """
+        documents = list(documents)
+        keys = [self.cache_key(text) for text in documents]
+
+        results = {}
+        missing = {}
+        for key, text in zip(keys, documents):
+            if key in results or key in missing:
+                continue
+            html = self._get_from_cache(key)
+            if html is None:
+                missing[key] = text
+            else:
+                results[key] = html
+
+        if missing:
+            workers = workers or os.cpu_count() or 1
+            if workers > 1 and len(missing) > chunksize:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                         initargs=(self.extensions, self.extension_configs)) as pool:
+                    rendered = pool.map(_render_in_worker, missing.values(), chunksize=chunksize)
+                    converted = dict(zip(missing, rendered))
+            else:
+                converted = {key: self.convert(text) for key, text in missing.items()}
+
+            for key, html in converted.items():
+                self._add_to_cache(key, html)
+            results.update(converted)
+
+        return [results[key] for key in keys]
+
+    def iter_render(self, source):
+        """
+        Render a document block by block, yielding HTML as it is produced.
+
+        Each top-level block is rendered through the block cache (sized by
+        block_cache_size, separately from the document cache) together with
+        the reference definitions it uses, so after an edit only the changed
+        blocks (and blocks using a changed definition) are converted again.
+        The concatenated output matches render() for the core Markdown
+        syntax; extensions that keep document-wide state (e.g. toc,
+        footnotes) are not supported.
+
+        Args:
+            source (str or file): Markdown source, or a seekable text file object
+
+        Yields:
+            str: HTML chunks
+        """
+        if isinstance(source, str):
+            lines = source.splitlines()
+            definitions = _reference_definitions(lines)
+        else:
+            definitions = _reference_definitions(source)
+            source.seek(0)
+            lines = source
+
+        tail = None
+        for block in split_blocks(lines):
+            html = self._render_block(_block_definitions(block, definitions) + block if definitions else block)
+            if not html.strip():
+                continue
+            stripped = html.rstrip()
+            yield stripped if tail is None else tail + "\n" + stripped
+            tail = html[len(stripped):]
+
+    def render_incremental(self, source):
+        """
+        Render a document block by block, re-converting only changed blocks.
+
+        Args:
+            source (str or file): Markdown source, or a seekable text file object
+
+        Returns:
+            str: Rendered HTML
+        """
+        return "".join(self.iter_render(source))
+
+    def render_to(self, source, out):
+        """
+        Stream the block-by-block rendering of a document to a writer.
+
+        Args:
+            source (str or file): Markdown source, or a seekable text file object
+            out (file): Object with a write() method
+        """
+        for chunk in self.iter_render(source):
+            out.write(chunk)
+
+    def render_directory(self, path, pattern="**/*.md", workers=None):
+        """
+        Render every Markdown file below a directory.
+
+        Args:
+            path (str): Directory to search
+            pattern (str): Glob pattern relative to path
+            workers (int, optional): Number of worker processes (default: CPU count)
+
+        Returns:
+            dict: Mapping of file path -> rendered HTML
+        """
+        paths = sorted(glob.glob(os.path.join(path, pattern), recursive=True))
+        documents = []
+        for file_path in paths:
+            with open(file_path, encoding="utf-8") as f:
+                documents.append(f.read())
+        return dict(zip(paths, self.render_many(documents, workers=workers)))
+
+    def cache_key(self, markdown_text):
+        """
+        Compute the cache key for a document under this renderer's configuration.
+
+        The key only depends on extension names, extension configs and the
+        source, so it is stable across processes and runs.
+
+        Args:
+            markdown_text (str): Markdown source
+
+        Returns:
+            str: Hex digest identifying the rendered output
+        """
+        digest = hashlib.sha256(self._config_key)
+        digest.update(b"\0")
+        digest.update(markdown_text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _render_block(self, block):
+        """
+        Render one top-level block, keeping the whitespace that follows it.
+
+        convert() strips its output, but in a full render a raw HTML block
+        keeps its trailing whitespace before the next element, so that is
+        cached with the block's HTML.
+
+        Args:
+            block (str): Block source
+
+        Returns:
+            str: Rendered HTML followed by its trailing whitespace
+        """
+        key = self.cache_key(block) + ".block"
+        html = self._get_from_cache(key, block=True)
+        if html is None:
+            with self._lock:
+                html = self._md.convert(block)
+                for raw in map(str, self._md.htmlStash.rawHtmlBlocks):
+                    stripped = raw.rstrip()
+                    if stripped and html.endswith(stripped):
+                        html += raw[len(stripped):]
+                        break
+                self._md.reset()
+            self._add_to_cache(key, html, block=True)
+        return html
+
+    def clear_cache(self):
+        """
+        Empty the memory caches (the on-disk cache is left untouched).
+        """
+        with self._cache_lock:
+            self.cache.clear()
+            self.block_cache.clear()
+
+    def _get_from_cache(self, cache_key, block=False):
+        """
+        Get rendered HTML from the memory or disk cache.
+
+        Args:
+            cache_key (str): Cache key to look up
+            block (bool): Whether to use the block cache instead of the document cache
+
+        Returns:
+            str or None: Cached HTML or None if not found
+        """
+        cache = self.block_cache if block else self.cache
+        with self._cache_lock:
+            html = cache.get(cache_key)
+            if html is not None:
+                cache.move_to_end(cache_key)
+                return html
+
+        if self.cache_dir:
+            cache_path = os.path.join(self.cache_dir, f"{cache_key}.html")
+            if os.path.exists(cache_path):
+                with open(cache_path, encoding="utf-8") as f:
+                    html = f.read()
+                self._remember(cache_key, html, block)
+                return html
+
+        return None
+
+    def _add_to_cache(self, cache_key, html, block=False):
+        """
+        Add rendered HTML to the memory cache and, if configured, the disk cache.
+
+        Args:
+            cache_key (str): Cache key to store HTML under
+            html (str): Rendered HTML
+            block (bool): Whether to use the block cache instead of the document cache
+        """
+        self._remember(cache_key, html, block)
+
+        if self.cache_dir:
+            cache_path = os.path.join(self.cache_dir, f"{cache_key}.html")
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(html)
+            os.replace(tmp_path, cache_path)
+
+    def _remember(self, cache_key, html, block=False):
+        """
+        Store HTML in a memory cache, evicting the least recently used entry.
+
+        Args:
+            cache_key (str): Cache key to store HTML under
+            html (str): Rendered HTML
+            block (bool): Whether to use the block cache instead of the document cache
+        """
+        cache, cache_size = (self.block_cache, self.block_cache_size) if block else (self.cache, self.cache_size)
+        with self._cache_lock:
+            cache[cache_key] = html
+            cache.move_to_end(cache_key)
+            if len(cache) > cache_size:
+                cache.popitem(last=False)
+
+
+_default_renderer = MarkdownRenderer()
+_worker_renderer = None
+
+
+def _extension_key(extension):
+    """
+    Stable identifier of an extension for cache keys.
+
+    Args:
+        extension (str or markdown.Extension): Extension name or instance
+
+    Returns:
+        str or list: The name, or the instance's class path and config
+    """
+    if isinstance(extension, str):
+        return extension
+    extension_type = type(extension)
+    return [f"{extension_type.__module__}.{extension_type.__qualname__}", extension.getConfigs()]
+
+
+def _init_worker(extensions, extension_configs):
+    global _worker_renderer
+    _worker_renderer = MarkdownRenderer(extensions=extensions, extension_configs=extension_configs, cache_size=0)
+
+
+def _render_in_worker(markdown_text):
+    return _worker_renderer.convert(markdown_text)
+
+
 def markdown_to_html(markdown_text):
-    return markdown.markdown(markdown_text)
\ No newline at end of file
+    return _default_renderer.render(markdown_text)
@@ -1,8 +1,16 @@
+try:
+    from monitoring.metrics import metrics
+    timed = metrics.timed
+except ImportError:  # Run as a script from inside match_agent/, without the repo root on sys.path
+    def timed(name):
+        return lambda func: func
+
 class MatchAgent:
     def __init__(self):
         # Initialize the agent with necessary configurations
         pass
 
+    @timed("match_agent_distribute_tasks")
     def distribute_tasks(self, students, tasks):
         assigned_tasks = {}
         sorted_students = sorted(students, key=lambda x: x['skill_level'], reverse=True)
@@ -0,0 +1,435 @@
+"""
+Message Bus Module
+
+Asyncio-based in-process message bus for Python agents in the ACP ecosystem.
+Each agent has a bounded mailbox; the bus supports point-to-point messages,
+request/reply, topic pub/sub, batch delivery and routing by capability
+through the AgentRegistry.
+
+Payloads are passed by reference: the bus never copies or serializes them,
+so a sender must not mutate a payload after sending it.
+"""
+
+import asyncio
+import itertools
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Message:
+    """
+    Envelope for a payload travelling over the bus.
+    """
+
+    __slots__ = ("id", "sender", "recipient", "topic", "payload", "reply_future")
+
+    def __init__(self, message_id, sender, recipient, payload, topic=None, reply_future=None):
+        """
+        Initialize a message.
+
+        Args:
+            message_id (int): Bus-unique message identifier
+            sender (str): ID of the sending agent (None for external senders)
+            recipient (str): ID of the receiving agent
+            payload: Payload object, passed by reference
+            topic (str, optional): Topic the message was published on
+            reply_future (asyncio.Future, optional): Future resolved by reply()
+        """
+        self.id = message_id
+        self.sender = sender
+        self.recipient = recipient
+        self.topic = topic
+        self.payload = payload
+        self.reply_future = reply_future
+
+    @property
+    def expects_reply(self):
+        """
+        bool: Whether the sender is waiting for a reply.
+        """
+        return self.reply_future is not None and not self.reply_future.done()
+
+
+class Mailbox:
+    """
+    Bounded inbox of a single agent.
+    """
+
+    def __init__(self, agent_id, maxsize):
+        """
+        Initialize the mailbox.
+
+        Args:
+            agent_id (str): Owner of the mailbox
+            maxsize (int): Maximum number of queued messages
+        """
+        self.agent_id = agent_id
+        self.queue = asyncio.Queue(maxsize)
+        self.topics = set()
+
+    async def receive(self):
+        """
+        Wait for the next message.
+
+        Returns:
+            Message: Next message in the mailbox
+        """
+        return await self.queue.get()
+
+    async def receive_batch(self, max_messages=64):
+        """
+        Wait for at least one message and return everything queued, up to a limit.
+
+        Args:
+            max_messages (int): Maximum number of messages to return
+
+        Returns:
+            list: Messages in arrival order
+        """
+        batch = [await self.queue.get()]
+        while len(batch) < max_messages and not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+        return batch
+
+    def qsize(self):
+        """
+        Returns:
+            int: Number of queued messages
+        """
+        return self.queue.qsize()
+
+
+class MessageBus:
+    """
+    In-process message bus connecting agents through bounded mailboxes.
+    Sending to a full mailbox waits, which applies backpressure to senders.
+    """
+
+    def __init__(self, agent_registry=None, config=None):
+        """
+        Initialize the message bus.
+
+        Args:
+            agent_registry (AgentRegistry, optional): Registry used for capability routing
+            config (dict, optional): Configuration parameters for the bus
+                - mailbox_size (int): Default mailbox capacity
+                - request_timeout (float): Default timeout for request() in seconds
+        """
+        self.registry = agent_registry
+        self.config = config or {}
+        self.mailbox_size = self.config.get("mailbox_size", 1000)
+        self.request_timeout = self.config.get("request_timeout", 30)
+
+        self.mailboxes = {}  # Dictionary of agent_id -> Mailbox
+        self.subscriptions = {}  # Index of topic -> [agent_ids]
+        self._message_ids = itertools.count(1)
+        self._round_robin = {}  # Index of capability -> counter
+        self._registered_agents = set()  # Agents this bus added to the registry
+
+    def register(self, agent_id, capabilities=None, metadata=None, mailbox_size=None):
+        """
+        Create a mailbox for an agent and register it with the registry.
+
+        Args:
+            agent_id (str): Unique identifier for the agent
+            capabilities (list, optional): Capabilities to register with the registry
+            metadata (dict, optional): Additional agent information for the registry
+            mailbox_size (int, optional): Capacity of this agent's mailbox
+
+        Returns:
+            Mailbox: The agent's mailbox
+
+        Raises:
+            ValueError: If the agent already has a mailbox
+        """
+        if agent_id in self.mailboxes:
+            raise ValueError(f"Agent {agent_id} already has a mailbox")
+
+        if self.registry is not None and capabilities is not None:
+            self.registry.register_agent(agent_id, capabilities, metadata)
+            self._registered_agents.add(agent_id)
+
+        mailbox = Mailbox(agent_id, mailbox_size or self.mailbox_size)
+        self.mailboxes[agent_id] = mailbox
+        return mailbox
+
+    def unregister(self, agent_id):
+        """
+        Remove an agent's mailbox and subscriptions.
+
+        The registry entry is only removed if register() created it; agents
+        registered with the registry directly stay registered.
+
+        Args:
+            agent_id (str): Agent to remove
+
+        Returns:
+            bool: Success of unregistration
+        """
+        mailbox = self.mailboxes.pop(agent_id, None)
+        if mailbox is None:
+            return False
+
+        for topic in mailbox.topics:
+            self.subscriptions[topic].remove(agent_id)
+            if not self.subscriptions[topic]:
+                del self.subscriptions[topic]
+
+        if agent_id in self._registered_agents:
+            self._registered_agents.discard(agent_id)
+            self.registry.unregister_agent(agent_id)
+        return True
+
+    def subscribe(self, agent_id, topic):
+        """
+        Subscribe an agent to a topic.
+
+        Args:
+            agent_id (str): Subscribing agent
+            topic (str): Topic to subscribe to
+        """
+        mailbox = self._mailbox(agent_id)
+        if topic not in mailbox.topics:
+            mailbox.topics.add(topic)
+            self.subscriptions.setdefault(topic, []).append(agent_id)
+
+    def unsubscribe(self, agent_id, topic):
+        """
+        Unsubscribe an agent from a topic.
+
+        Args:
+            agent_id (str): Subscribed agent
+            topic (str): Topic to unsubscribe from
+        """
+        mailbox = self._mailbox(agent_id)
+        if topic in mailbox.topics:
+            mailbox.topics.remove(topic)
+            self.subscriptions[topic].remove(agent_id)
+            if not self.subscriptions[topic]:
+                del self.subscriptions[topic]
+
+    async def send(self, recipient, payload, sender=None):
+        """
+        Send a payload to an agent, waiting while its mailbox is full.
+
+        Args:
+            recipient (str): Receiving agent
+            payload: Payload object, passed by reference
+            sender (str, optional): Sending agent
+
+        Returns:
+            int: Message ID
+        """
+        message = Message(next(self._message_ids), sender, recipient, payload)
+        await self._mailbox(recipient).queue.put(message)
+        return message.id
+
+    async def send_batch(self, recipient, payloads, sender=None):
+        """
+        Deliver several payloads to one agent, only yielding when its mailbox fills up.
+
+        Args:
+            recipient (str): Receiving agent
+            payloads (iterable): Payload objects, passed by reference
+            sender (str, optional): Sending agent
+
+        Returns:
+            int: Number of messages delivered
+        """
+        queue = self._mailbox(recipient).queue
+        count = 0
+        for payload in payloads:
+            message = Message(next(self._message_ids), sender, recipient, payload)
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                await queue.put(message)
+            count += 1
+        return count
+
+    async def request(self, recipient, payload, sender=None, timeout=None):
+        """
+        Send a payload and wait for the recipient's reply.
+
+        Args:
+            recipient (str): Receiving agent
+            payload: Payload object, passed by reference
+            sender (str, optional): Sending agent
+            timeout (float, optional): Seconds to wait (default: request_timeout)
+
+        Returns:
+            object: Reply payload
+
+        Raises:
+            asyncio.TimeoutError: If no reply arrives in time
+        """
+        future = asyncio.get_running_loop().create_future()
+        message = Message(next(self._message_ids), sender, recipient, payload, reply_future=future)
+        await self._mailbox(recipient).queue.put(message)
+        return await asyncio.wait_for(future, timeout or self.request_timeout)
+
+    def reply(self, message, payload):
+        """
+        Answer a message sent with request().
+
+        Args:
+            message (Message): The request being answered
+            payload: Reply payload, passed by reference
+
+        Returns:
+            bool: False if the requester is no longer waiting
+        """
+        if not message.expects_reply:
+            return False
+        message.reply_future.set_result(payload)
+        return True
+
+    def reply_error(self, message, error):
+        """
+        Fail a request() with an exception on the requester's side.
+
+        Args:
+            message (Message): The request being answered
+            error (Exception): Exception to raise in the requester
+
+        Returns:
+            bool: False if the requester is no longer waiting
+        """
+        if not message.expects_reply:
+            return False
+        message.reply_future.set_exception(error)
+        return True
+
+    async def publish(self, topic, payload, sender=None):
+        """
+        Deliver a payload to every subscriber of a topic.
+
+        All subscribers receive the same payload object. Subscribers that are
+        unregistered while the delivery waits on a full mailbox are skipped.
+
+        Args:
+            topic (str): Topic to publish on
+            payload: Payload object, passed by reference
+            sender (str, optional): Sending agent
+
+        Returns:
+            int: Number of messages delivered
+        """
+        delivered = 0
+        for agent_id in list(self.subscriptions.get(topic, [])):
+            mailbox = self.mailboxes.get(agent_id)
+            if mailbox is None:
+                continue
+            message = Message(next(self._message_ids), sender, agent_id, payload, topic=topic)
+            await mailbox.queue.put(message)
+            delivered += 1
+        return delivered
+
+    def route(self, capability, min_trust_level=0):
+        """
+        Pick an agent for a capability, rotating over the registry's matches.
+
+        Only agents with a mailbox on this bus are considered.
+
+        Args:
+            capability (str): Required capability
+            min_trust_level (float, optional): Minimum trust level required
+
+        Returns:
+            str: Selected agent ID
+
+        Raises:
+            ValueError: If no registry is configured or no agent provides the capability
+        """
+        if self.registry is None:
+            raise ValueError("Capability routing requires an agent registry")
+
+        candidates = [
+            agent_id for agent_id in self.registry.discover_agents_by_capability(capability, min_trust_level)
+            if agent_id in self.mailboxes
+        ]
+        if not candidates:
+            raise ValueError(f"No agent on the bus provides capability: {capability}")
+
+        counter = self._round_robin.get(capability, 0)
+        self._round_robin[capability] = counter + 1
+        return candidates[counter % len(candidates)]
+
+    async def send_to_capability(self, capability, payload, sender=None, min_trust_level=0):
+        """
+        Send a payload to an agent providing a capability.
+
+        Args:
+            capability (str): Required capability
+            payload: Payload object, passed by reference
+            sender (str, optional): Sending agent
+            min_trust_level (float, optional): Minimum trust level required
+
+        Returns:
+            int: Message ID
+        """
+        return await self.send(self.route(capability, min_trust_level), payload, sender)
+
+    async def request_capability(self, capability, payload, sender=None, min_trust_level=0, timeout=None):
+        """
+        Send a request to an agent providing a capability and wait for the reply.
+
+        Args:
+            capability (str): Required capability
+            payload: Payload object, passed by reference
+            sender (str, optional): Sending agent
+            min_trust_level (float, optional): Minimum trust level required
+            timeout (float, optional): Seconds to wait (default: request_timeout)
+
+        Returns:
+            object: Reply payload
+        """
+        recipient = self.route(capability, min_trust_level)
+        return await self.request(recipient, payload, sender, timeout)
+
+    async def serve(self, agent_id, handler, batch_size=64):
+        """
+        Run an agent's receive loop until cancelled.
+
+        The handler is called with each message; its return value (sync or
+        awaitable) is sent back when the message came from request(), and
+        exceptions it raises are forwarded to the requester. An exception
+        from a message that expects no reply is logged and the loop keeps
+        serving the remaining messages.
+
+        Args:
+            agent_id (str): Agent whose mailbox to serve
+            handler (callable): Function taking a Message
+            batch_size (int): Maximum messages taken from the mailbox at once
+        """
+        mailbox = self._mailbox(agent_id)
+        while True:
+            for message in await mailbox.receive_batch(batch_size):
+                try:
+                    result = handler(message)
+                    if asyncio.iscoroutine(result):
+                        result = await result
+                except Exception as error:
+                    if not self.reply_error(message, error):
+                        logger.exception("Agent %s failed to handle message %s", agent_id, message.id)
+                else:
+                    self.reply(message, result)
+
+    def _mailbox(self, agent_id):
+        """
+        Internal method to look up an agent's mailbox.
+
+        Args:
+            agent_id (str): Agent to look up
+
+        Returns:
+            Mailbox: The agent's mailbox
+
+        Raises:
+            ValueError: If the agent has no mailbox
+        """
+        mailbox = self.mailboxes.get(agent_id)
+        if mailbox is None:
+            raise ValueError(f"Agent {agent_id} has no mailbox")
+        return mailbox
@@ -0,0 +1,112 @@
+import asyncio
+import unittest
+from messaging.message_bus import MessageBus
+from registry.agent_registry import AgentRegistry
+
+class TestMessageBus(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.registry = AgentRegistry()
+        self.bus = MessageBus(self.registry, {"mailbox_size": 4})
+
+    async def test_send_passes_payload_by_reference(self):
+        mailbox = self.bus.register("match_agent")
+        payload = {"tasks": [1, 2, 3]}
+        await self.bus.send("match_agent", payload, sender="orchestrator")
+        message = await mailbox.receive()
+        self.assertIs(message.payload, payload)
+        self.assertEqual(message.sender, "orchestrator")
+
+    async def test_bounded_mailbox_applies_backpressure(self):
+        mailbox = self.bus.register("match_agent")
+        sender = asyncio.create_task(self.bus.send_batch("match_agent", range(6)))
+        await asyncio.sleep(0)
+        self.assertFalse(sender.done())
+        self.assertEqual(mailbox.qsize(), 4)
+
+        received = [m.payload for m in await mailbox.receive_batch(10)]
+        self.assertEqual(await sender, 6)
+        received += [m.payload for m in await mailbox.receive_batch(10)]
+        self.assertEqual(received, list(range(6)))
+
+    async def test_request_reply(self):
+        self.bus.register("learning_agent")
+        server = asyncio.create_task(self.bus.serve("learning_agent", lambda m: sum(m.payload)))
+        self.assertEqual(await self.bus.request("learning_agent", [85, 90, 78]), 253)
+        server.cancel()
+
+    async def test_request_forwards_handler_errors(self):
+        async def handler(message):
+            raise KeyError(message.payload)
+
+        self.bus.register("learning_agent")
+        server = asyncio.create_task(self.bus.serve("learning_agent", handler))
+        with self.assertRaises(KeyError):
+            await self.bus.request("learning_agent", "student_123")
+        server.cancel()
+
+    async def test_serve_survives_handler_errors(self):
+        handled = []
+
+        def handler(message):
+            if message.payload == 1:
+                raise ValueError("bad message")
+            handled.append(message.payload)
+            return message.payload
+
+        self.bus.register("match_agent")
+        await self.bus.send_batch("match_agent", [0, 1, 2, 3])
+        with self.assertLogs("messaging.message_bus", level="ERROR"):
+            server = asyncio.create_task(self.bus.serve("match_agent", handler))
+            self.assertEqual(await self.bus.request("match_agent", 4, timeout=1), 4)
+        self.assertEqual(handled, [0, 2, 3, 4])
+        self.assertFalse(server.done())
+        server.cancel()
+
+    async def test_publish_subscribe(self):
+        schedule = self.bus.register("schedule_agent")
+        match = self.bus.register("match_agent")
+        self.bus.subscribe("schedule_agent", "schedule.updated")
+        self.bus.subscribe("match_agent", "schedule.updated")
+        self.bus.unsubscribe("match_agent", "schedule.updated")
+
+        self.assertEqual(await self.bus.publish("schedule.updated", {"day": "Monday"}), 1)
+        self.assertEqual((await schedule.receive()).topic, "schedule.updated")
+        self.assertEqual(match.qsize(), 0)
+
+    async def test_publish_skips_agents_unregistered_while_waiting(self):
+        bus = MessageBus(config={"mailbox_size": 1})
+        schedule = bus.register("schedule_agent")
+        bus.register("match_agent")
+        bus.subscribe("schedule_agent", "schedule.updated")
+        bus.subscribe("match_agent", "schedule.updated")
+        await bus.send("schedule_agent", "pending")
+
+        publisher = asyncio.create_task(bus.publish("schedule.updated", {"day": "Monday"}))
+        await asyncio.sleep(0)
+        bus.unregister("match_agent")
+        await schedule.receive()
+        self.assertEqual(await publisher, 1)
+        self.assertEqual((await schedule.receive()).topic, "schedule.updated")
+
+    async def test_route_by_capability(self):
+        self.bus.register("match_1", capabilities=["assign"])
+        self.bus.register("match_2", capabilities=["assign"], metadata={"trust_level": 0.2})
+        self.assertEqual(self.registry.discover_agents_by_capability("assign"), ["match_1", "match_2"])
+
+        routed = [self.bus.route("assign") for _ in range(4)]
+        self.assertEqual(routed, ["match_1", "match_2", "match_1", "match_2"])
+        self.assertEqual(self.bus.route("assign", min_trust_level=0.5), "match_1")
+
+        self.bus.unregister("match_1")
+        self.assertNotIn("match_1", self.registry.agents)
+
+        self.registry.register_agent("external", ["assign"])
+        self.bus.register("external")
+        self.bus.unregister("external")
+        self.assertIn("external", self.registry.agents)
+        self.registry.unregister_agent("external")
+        with self.assertRaises(ValueError):
+            self.bus.route("assign", min_trust_level=0.5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,249 @@
+"""
+Metrics Module
+
+Low-overhead timers and counters for the Python agent stack, exportable as
+JSON or Prometheus text. Instrumentation is off by default; while disabled,
+an instrumented call only adds a wrapper call and one attribute check.
+Enable it with metrics.enable() or by setting the ACP_METRICS environment
+variable.
+"""
+
+import functools
+import json
+import os
+import re
+import time
+
+# Upper bounds (seconds) of the Prometheus histogram buckets for timers
+DEFAULT_BUCKETS = (0.00001, 0.0001, 0.001, 0.01, 0.1, 1.0, 10.0)
+
+
+class _NullTimer:
+    """
+    Context manager used while metrics are disabled.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    """
+    Context manager recording the duration of its block.
+    """
+
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics.observe(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Metrics:
+    """
+    Collection of named counters and timers.
+    """
+
+    def __init__(self, enabled=False, buckets=DEFAULT_BUCKETS, namespace="acp"):
+        """
+        Initialize the metrics collection.
+
+        Args:
+            enabled (bool): Whether to record measurements
+            buckets (tuple): Histogram bucket upper bounds in seconds
+            namespace (str): Prefix for exported Prometheus metric names
+        """
+        self.enabled = enabled
+        self.buckets = tuple(buckets)
+        self.namespace = namespace
+        self.counters = {}  # Dictionary of name -> value
+        self.timers = {}  # Dictionary of name -> [count, total, min, max, bucket counts]
+
+    def enable(self):
+        """
+        Start recording measurements.
+        """
+        self.enabled = True
+
+    def disable(self):
+        """
+        Stop recording measurements (collected values are kept).
+        """
+        self.enabled = False
+
+    def reset(self):
+        """
+        Discard all collected values.
+        """
+        self.counters.clear()
+        self.timers.clear()
+
+    def increment(self, name, value=1):
+        """
+        Add to a counter.
+
+        Args:
+            name (str): Counter name
+            value (int): Amount to add
+        """
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name, seconds):
+        """
+        Record a duration for a timer.
+
+        Args:
+            name (str): Timer name
+            seconds (float): Measured duration
+        """
+        if not self.enabled:
+            return
+
+        stats = self.timers.get(name)
+        if stats is None:
+            stats = self.timers[name] = [0, 0.0, seconds, seconds, [0] * len(self.buckets)]
+        stats[0] += 1
+        stats[1] += seconds
+        if seconds < stats[2]:
+            stats[2] = seconds
+        if seconds > stats[3]:
+            stats[3] = seconds
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                stats[4][i] += 1
+                break
+
+    def timer(self, name):
+        """
+        Time a block of code.
+
+        Args:
+            name (str): Timer name
+
+        Returns:
+            context manager: Records the block's duration when metrics are enabled
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def timed(self, name):
+        """
+        Decorator timing every call of a function and counting failures.
+
+        Args:
+            name (str): Timer name; failed calls count towards "<name>_errors"
+
+        Returns:
+            callable: Decorator
+        """
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                except Exception:
+                    self.increment(f"{name}_errors")
+                    raise
+                finally:
+                    self.observe(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    def snapshot(self):
+        """
+        Get the current values.
+
+        Returns:
+            dict: Counters and per-timer count/total/mean/min/max in seconds
+        """
+        timers = {}
+        for name, (count, total, minimum, maximum, _) in self.timers.items():
+            timers[name] = {
+                "count": count,
+                "total": total,
+                "mean": total / count,
+                "min": minimum,
+                "max": maximum
+            }
+        return {"counters": dict(self.counters), "timers": timers}
+
+    def export(self, format="json"):
+        """
+        Export the current values.
+
+        Args:
+            format (str): "json" or "prometheus"
+
+        Returns:
+            str: Exported metrics
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        if format == "json":
+            return json.dumps(self.snapshot(), indent=2, sort_keys=True)
+        if format == "prometheus":
+            return self._export_prometheus()
+        raise ValueError(f"Unsupported metrics format: {format}")
+
+    def _export_prometheus(self):
+        """
+        Internal method rendering counters and timer histograms in Prometheus text format.
+
+        Returns:
+            str: Prometheus exposition text
+        """
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            metric = self._metric_name(name) + "_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+
+        for name, (count, total, _, _, bucket_counts) in sorted(self.timers.items()):
+            metric = self._metric_name(name) + "_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                lines.append(f'{metric}_bucket{{le="{bound:g}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{le="+Inf"}} {count}')
+            lines.append(f"{metric}_sum {total!r}")
+            lines.append(f"{metric}_count {count}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _metric_name(self, name):
+        """
+        Internal method turning a metric name into a valid Prometheus name.
+
+        Args:
+            name (str): Metric name
+
+        Returns:
+            str: Namespaced Prometheus metric name
+        """
+        return re.sub(r"[^a-zA-Z0-9_]", "_", f"{self.namespace}_{name}")
+
+
+# Shared metrics used by the instrumented agent stack
+metrics = Metrics(enabled=os.environ.get("ACP_METRICS", "") not in ("", "0"))
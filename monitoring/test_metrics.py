@@ -0,0 +1,79 @@
+import json
+import unittest
+from governance.auditor import DecisionAuditor
+from monitoring.metrics import Metrics, metrics
+from orchestration.orchestrator import Orchestrator
+from registry.agent_registry import AgentRegistry
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.metrics = Metrics()
+
+    def test_disabled_by_default(self):
+        @self.metrics.timed("work")
+        def work():
+            return 42
+
+        self.assertEqual(work(), 42)
+        self.metrics.increment("calls")
+        with self.metrics.timer("block"):
+            pass
+        self.assertEqual(self.metrics.snapshot(), {"counters": {}, "timers": {}})
+
+    def test_timed_records_calls_and_errors(self):
+        self.metrics.enable()
+
+        @self.metrics.timed("work")
+        def work(fail):
+            if fail:
+                raise ValueError("failed")
+
+        work(False)
+        with self.assertRaises(ValueError):
+            work(True)
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot["timers"]["work"]["count"], 2)
+        self.assertEqual(snapshot["counters"], {"work_errors": 1})
+
+    def test_export(self):
+        self.metrics.enable()
+        self.metrics.increment("workflows")
+        self.metrics.observe("select", 0.005)
+        self.metrics.observe("select", 5)
+
+        self.assertEqual(json.loads(self.metrics.export("json"))["timers"]["select"]["max"], 5)
+        prometheus = self.metrics.export("prometheus").splitlines()
+        self.assertIn("acp_workflows_total 1", prometheus)
+        self.assertIn('acp_select_seconds_bucket{le="0.01"} 1', prometheus)
+        self.assertIn('acp_select_seconds_bucket{le="+Inf"} 2', prometheus)
+        self.assertIn("acp_select_seconds_count 2", prometheus)
+        with self.assertRaises(ValueError):
+            self.metrics.export("xml")
+
+class TestAgentStackInstrumentation(unittest.TestCase):
+    def setUp(self):
+        metrics.reset()
+        metrics.enable()
+
+    def tearDown(self):
+        metrics.disable()
+        metrics.reset()
+
+    def test_workflow_is_instrumented(self):
+        registry = AgentRegistry()
+        registry.register_agent("schedule_agent", ["update_calendar"])
+        orchestrator = Orchestrator(registry, DecisionAuditor())
+        orchestrator.execute_workflow(orchestrator.create_workflow({"type": "schedule_update"}))
+        with self.assertRaises(ValueError):
+            orchestrator.create_workflow({"type": "task_assignment"})
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["counters"]["orchestrator_workflows_created"], 1)
+        self.assertEqual(snapshot["counters"]["orchestrator_workflows_completed"], 1)
+        self.assertEqual(snapshot["counters"]["orchestrator_unmatched_capabilities"], 2)
+        self.assertEqual(snapshot["counters"]["orchestrator_create_workflow_errors"], 1)
+        self.assertEqual(snapshot["timers"]["auditor_log_decision"]["count"], 2)
+        self.assertEqual(snapshot["timers"]["registry_discover"]["count"], 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 import datetime
 
+from monitoring.metrics import metrics
+
 class Orchestrator:
     """
     Coordinates agent activities by analyzing tasks, selecting appropriate agents,
@@ -45,6 +47,7 @@ class Orchestrator:
 
         return required_capabilities
 
+    @metrics.timed("orchestrator_select_agents")
     def select_agents(self, required_capabilities, min_trust_level=0.5):
         """
         Select appropriate agents based on required capabilities.
@@ -64,6 +67,7 @@ class Orchestrator:
 
             if not agents:
                 # No agent found with required capability
+                metrics.increment("orchestrator_unmatched_capabilities")
                 continue
 
             # For simplicity, select the first available agent
@@ -72,6 +76,7 @@ class Orchestrator:
 
         return selected_agents
 
+    @metrics.timed("orchestrator_create_workflow")
     def create_workflow(self, task_description):
         """
         Create a new workflow for a task.
@@ -105,6 +110,7 @@ class Orchestrator:
         }
 
         self.active_workflows[workflow_id] = workflow
+        metrics.increment("orchestrator_workflows_created")
 
         # Audit this decision if auditor is available
         if self.auditor:
@@ -117,6 +123,7 @@ class Orchestrator:
 
         return workflow_id
 
+    @metrics.timed("orchestrator_execute_workflow")
     def execute_workflow(self, workflow_id):
         """
         Execute a workflow by coordinating agent activities.
@@ -138,6 +145,7 @@ class Orchestrator:
 
         workflow["status"] = "completed"
         workflow["completed_at"] = datetime.datetime.now().isoformat()
+        metrics.increment("orchestrator_workflows_completed")
 
         # Audit workflow completion
         if self.auditor:
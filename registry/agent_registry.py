@@ -1,3 +1,5 @@
+from monitoring.metrics import metrics
+
 class AgentRegistry:
   """
   Central registry for managing agents in the ACP ecosystem.
@@ -15,6 +17,7 @@ class AgentRegistry:
       self.capabilities_index = {}  # Index of capability -> [agent_ids]
       self.config = config or {}
 
+  @metrics.timed("registry_register_agent")
   def register_agent(self, agent_id, capabilities, metadata=None):
       """
       Register a new agent with the system.
@@ -30,7 +33,20 @@ class AgentRegistry:
       Raises:
           ValueError: If agent_id already exists or capabilities are invalid
       """
-      pass
+      if agent_id in self.agents:
+          raise ValueError(f"Agent {agent_id} already exists")
+      if not self._validate_capabilities(capabilities):
+          raise ValueError(f"Invalid capabilities for agent {agent_id}: {capabilities}")
+
+      metadata = metadata or {}
+      self.agents[agent_id] = {
+          "id": agent_id,
+          "capabilities": list(capabilities),
+          "metadata": metadata,
+          "trust_level": metadata.get("trust_level", self.config.get("default_trust_level", 1.0))
+      }
+      self._index_capabilities(agent_id, capabilities)
+      return True
 
   def unregister_agent(self, agent_id):
       """
@@ -42,7 +58,12 @@ class AgentRegistry:
       Returns:
           bool: Success of unregistration
       """
-      pass
+      if agent_id not in self.agents:
+          return False
+
+      self._unindex_capabilities(agent_id, self.agents[agent_id]["capabilities"])
+      del self.agents[agent_id]
+      return True
 
   def update_agent_capabilities(self, agent_id, capabilities):
       """
@@ -55,8 +76,15 @@ class AgentRegistry:
       Returns:
           bool: Success of update
       """
-      pass
+      if agent_id not in self.agents or not self._validate_capabilities(capabilities):
+          return False
 
+      self._unindex_capabilities(agent_id, self.agents[agent_id]["capabilities"])
+      self.agents[agent_id]["capabilities"] = list(capabilities)
+      self._index_capabilities(agent_id, capabilities)
+      return True
+
+  @metrics.timed("registry_discover")
   def discover_agents_by_capability(self, capability, min_trust_level=0):
       """
       Find agents that can provide a specific capability.
@@ -68,7 +96,10 @@ class AgentRegistry:
       Returns:
           list: List of agent_ids that provide the capability
       """
-      pass
+      return [
+          agent_id for agent_id in self.capabilities_index.get(capability, [])
+          if self.agents[agent_id]["trust_level"] >= min_trust_level
+      ]
 
   def get_agent_details(self, agent_id):
       """
@@ -80,7 +111,7 @@ class AgentRegistry:
       Returns:
           dict: Complete agent information
       """
-      pass
+      return self.agents.get(agent_id)
 
   def _validate_capabilities(self, capabilities):
       """
@@ -92,4 +123,34 @@ class AgentRegistry:
       Returns:
           bool: Validation result
       """
-      pass
+      if not isinstance(capabilities, (list, tuple, set)):
+          return False
+      return all(isinstance(capability, str) and capability for capability in capabilities)
+
+  def _index_capabilities(self, agent_id, capabilities):
+      """
+      Internal method to add an agent to the capability index.
+
+      Args:
+          agent_id (str): Agent to index
+          capabilities (list): Capabilities to index the agent under
+      """
+      for capability in capabilities:
+          agents = self.capabilities_index.setdefault(capability, [])
+          if agent_id not in agents:
+              agents.append(agent_id)
+
+  def _unindex_capabilities(self, agent_id, capabilities):
+      """
+      Internal method to remove an agent from the capability index.
+
+      Args:
+          agent_id (str): Agent to remove
+          capabilities (list): Capabilities the agent was indexed under
+      """
+      for capability in capabilities:
+          agents = self.capabilities_index.get(capability, [])
+          if agent_id in agents:
+              agents.remove(agent_id)
+          if not agents:
+              self.capabilities_index.pop(capability, None)
@@ -0,0 +1,30 @@
+import unittest
+from registry.agent_registry import AgentRegistry
+
+class TestAgentRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = AgentRegistry()
+        self.registry.register_agent("match_agent", ["evaluate", "assign"], {"trust_level": 0.8})
+        self.registry.register_agent("learning_agent", ["analyze", "suggest_module"])
+
+    def test_register_agent(self):
+        self.assertEqual(self.registry.get_agent_details("match_agent")["trust_level"], 0.8)
+        self.assertEqual(self.registry.capabilities_index["assign"], ["match_agent"])
+        with self.assertRaises(ValueError):
+            self.registry.register_agent("match_agent", ["assign"])
+        with self.assertRaises(ValueError):
+            self.registry.register_agent("broken_agent", "assign")
+
+    def test_discover_agents_by_capability(self):
+        self.assertEqual(self.registry.discover_agents_by_capability("assign"), ["match_agent"])
+        self.assertEqual(self.registry.discover_agents_by_capability("assign", min_trust_level=0.9), [])
+
+    def test_update_and_unregister(self):
+        self.assertTrue(self.registry.update_agent_capabilities("match_agent", ["assign"]))
+        self.assertNotIn("evaluate", self.registry.capabilities_index)
+        self.assertTrue(self.registry.unregister_agent("match_agent"))
+        self.assertFalse(self.registry.unregister_agent("match_agent"))
+        self.assertEqual(self.registry.discover_agents_by_capability("assign"), [])
+
+if __name__ == '__main__':
+    unittest.main()
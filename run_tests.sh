@@ -1,3 +1,3 @@
 python3 schedule_agent/test_schedule_agent.py
 python3 match_agent/test_match_agent.py
-python3 learning_agent/test_learning_agent.py
\ No newline at end of file
+python3 -m unittest learning_agent.test_learning_agent learning_agent.test_module_catalog
\ No newline at end of file
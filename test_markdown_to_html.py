@@ -1,5 +1,8 @@
+import io
+import os
+import tempfile
 import unittest
-from markdown_to_html import markdown_to_html
+from markdown_to_html import MarkdownRenderer, markdown_to_html
 
 class TestMarkdownToHtml(unittest.TestCase):
     def test_heading(self):
@@ -16,5 +19,111 @@ class TestMarkdownToHtml(unittest.TestCase):
         html = "<ul><li>Item 1</li><li>Item 2</li><li>Item 3</li></ul>"
         self.assertEqual(markdown_to_html(markdown), html)
 
+class TestMarkdownRenderer(unittest.TestCase):
+    def setUp(self):
+        self.renderer = MarkdownRenderer(cache_size=2)
+
+    def test_render_reuses_instance(self):
+        self.assertEqual(self.renderer.render("# Heading 1"), "<h1>Heading 1</h1>")
+        self.assertEqual(self.renderer.render("**bold**"), "<p><strong>bold</strong></p>")
+        self.assertEqual(self.renderer.render("# Heading 1"), "<h1>Heading 1</h1>")
+
+    def test_cache_is_lru(self):
+        for text in ("a", "b", "a", "c"):
+            self.renderer.render(text)
+        self.assertEqual(list(self.renderer.cache),
+                         [self.renderer.cache_key("a"), self.renderer.cache_key("c")])
+
+    def test_cache_key_is_stable_and_covers_configs(self):
+        from markdown.extensions.toc import TocExtension
+        self.assertEqual(MarkdownRenderer(extensions=[TocExtension(permalink=True)]).cache_key("# A"),
+                         MarkdownRenderer(extensions=[TocExtension(permalink=True)]).cache_key("# A"))
+        self.assertNotEqual(MarkdownRenderer(extensions=["toc"]).cache_key("# A"),
+                            MarkdownRenderer(extensions=["toc"],
+                                             extension_configs={"toc": {"permalink": True}}).cache_key("# A"))
+
+    def test_disk_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            MarkdownRenderer(cache_dir=cache_dir).render("*italic*")
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            renderer = MarkdownRenderer(cache_dir=cache_dir)
+            self.assertEqual(renderer._get_from_cache(renderer.cache_key("*italic*")), "<p><em>italic</em></p>")
+
+    def test_render_many_on_pool(self):
+        documents = [f"# Doc {i % 10}" for i in range(40)]
+        html = MarkdownRenderer().render_many(documents, workers=2, chunksize=2)
+        self.assertEqual(html, [f"<h1>Doc {i % 10}</h1>" for i in range(40)])
+
+    def test_render_directory(self):
+        with tempfile.TemporaryDirectory() as path:
+            with open(os.path.join(path, "a.md"), "w", encoding="utf-8") as f:
+                f.write("# A")
+            self.assertEqual(self.renderer.render_directory(path), {os.path.join(path, "a.md"): "<h1>A</h1>"})
+
+class TestIncrementalRendering(unittest.TestCase):
+    document = "\n\n".join([
+        "# Heading 1",
+        "**bold** and *italic* with a [link][ref]",
+        "- Item 1\n- Item 2\n\n- Item 3",
+        "> quote\n\n> more",
+        "    code\n\n    more code",
+        "<div>\n\nraw\n\n</div>",
+        "[ref]: http://example.com",
+    ])
+
+    def setUp(self):
+        self.renderer = MarkdownRenderer()
+
+    def test_matches_full_render(self):
+        for markdown in ("# Heading 1", "**bold**", "*italic*", "- Item 1\n- Item 2\n- Item 3", self.document,
+                         "[Note]: remember to update this section\n\nSee [docs] and [the list].\n\n- [ ] task one",
+                         "[x]: <a b>\n\n[x]"):
+            self.assertEqual(self.renderer.render_incremental(markdown), self.renderer.convert(markdown))
+
+    def test_reference_title_on_unindented_next_line(self):
+        markdown = '[a]\n\n[a]: /url\n"title"'
+        self.assertEqual(self.renderer.render_incremental(markdown), self.renderer.convert(markdown))
+        self.assertIn('title="title"', self.renderer.render_incremental(markdown))
+
+    def test_only_changed_blocks_are_converted(self):
+        self.renderer.render_incremental(self.document)
+        converted = []
+        convert = self.renderer._md.convert
+        self.renderer._md.convert = lambda text: converted.append(text) or convert(text)
+
+        edited = self.document.replace("# Heading 1", "# Heading 2")
+        self.assertEqual(self.renderer.render_incremental(edited), self.renderer.convert(edited))
+        self.assertEqual(converted[:-1], ["# Heading 2"])
+
+    def test_blocks_outnumbering_document_cache_are_reused(self):
+        renderer = MarkdownRenderer(cache_size=4)
+        document = "\n\n".join(f"Paragraph {i}" for i in range(20))
+        renderer.render_incremental(document)
+        converted = []
+        convert = renderer._md.convert
+        renderer._md.convert = lambda text: converted.append(text) or convert(text)
+
+        edited = document.replace("Paragraph 7", "Paragraph seven")
+        self.assertEqual(renderer.render_incremental(edited), renderer.convert(edited))
+        self.assertEqual(converted[:-1], ["Paragraph seven"])
+
+    def test_blocks_only_depend_on_used_definitions(self):
+        document = "\n\n".join([f"See [link {i}][r{i}]." for i in range(5)] +
+                                 [f"[r{i}]: /url/{i}" for i in range(5)])
+        self.renderer.render_incremental(document)
+        converted = []
+        convert = self.renderer._md.convert
+        self.renderer._md.convert = lambda text: converted.append(text) or convert(text)
+
+        edited = document.replace("/url/3", "/url/three")
+        self.assertEqual(self.renderer.render_incremental(edited), self.renderer.convert(edited))
+        self.assertEqual(converted[:-1], ["[r3]: /url/three\n\nSee [link 3][r3].",
+                                          "[r3]: /url/three\n\n[r3]: /url/three"])
+
+    def test_render_to_streams_from_file(self):
+        out = io.StringIO()
+        self.renderer.render_to(io.StringIO(self.document), out)
+        self.assertEqual(out.getvalue(), self.renderer.convert(self.document))
+
 if __name__ == "__main__":
     unittest.main()